@@ -2,7 +2,7 @@
 Entry point for running aigernon as a module: python -m aigernon
 """
 
-from aigernon.cli.commands import app
+from aigernon.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
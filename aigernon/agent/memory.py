@@ -1,12 +1,46 @@
 """Memory system for persistent agent memory with ADD realm tracking."""
 
+import os
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import Counter
 import re
 
 from aigernon.utils.helpers import ensure_dir, today_date
 
+_REALM_EMOJI = {"assess": "🔴", "decide": "🟠", "do": "🟢"}
+_UNKNOWN_EMOJI = "⚪"
+_REALM_INDEX = {b"ASSESS": 0, b"DECIDE": 1, b"DO": 2}
+
+# Match realm log entries: "- HH:MM 🔴 ASSESS" etc. Runs over the raw UTF-8
+# bytes of the notes file so the whole day never has to be decoded.
+_REALM_RE = re.compile(
+    rb"- \d{2}:\d{2} (?:"
+    + b"|".join(re.escape(e.encode("utf-8")) for e in (*_REALM_EMOJI.values(), _UNKNOWN_EMOJI))
+    + rb") (ASSESS|DECIDE|DO)"
+)
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a file in one call, returning b"" if it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 file in one call, returning "" if it does not exist."""
+    return _read_bytes(path).decode("utf-8")
+
+
+def _write_text(path: Path, content: str) -> None:
+    """Write a UTF-8 file in one call, bypassing text-mode buffering."""
+    with open(path, "wb") as f:
+        f.write(content.encode("utf-8"))
+
 
 class MemoryStore:
     """
@@ -19,41 +53,47 @@ class MemoryStore:
         self.workspace = workspace
         self.memory_dir = ensure_dir(workspace / "memory")
         self.memory_file = self.memory_dir / "MEMORY.md"
+        self._today_str: str | None = None
+        self._today_path: Path | None = None
+        self._today_expires = 0.0  # epoch seconds of the next local midnight
     
     def get_today_file(self) -> Path:
-        """Get path to today's memory file."""
-        return self.memory_dir / f"{today_date()}.md"
+        """Get path to today's memory file (cached until the date rolls over)."""
+        if time.time() >= self._today_expires:
+            self._today_str = today_date()
+            self._today_path = self.memory_dir / f"{self._today_str}.md"
+            tomorrow = datetime.strptime(self._today_str, "%Y-%m-%d") + timedelta(days=1)
+            self._today_expires = tomorrow.timestamp()
+        return self._today_path
     
     def read_today(self) -> str:
         """Read today's memory notes."""
-        today_file = self.get_today_file()
-        if today_file.exists():
-            return today_file.read_text(encoding="utf-8")
-        return ""
+        return _read_text(self.get_today_file())
     
     def append_today(self, content: str) -> None:
         """Append content to today's memory notes."""
         today_file = self.get_today_file()
         
-        if today_file.exists():
-            existing = today_file.read_text(encoding="utf-8")
-            content = existing + "\n" + content
-        else:
-            # Add header for new day
-            header = f"# {today_date()}\n\n"
-            content = header + content
-        
-        today_file.write_text(content, encoding="utf-8")
+        # O_APPEND makes each entry a single atomic write at end-of-file;
+        # an empty file after open means this is the first entry of the day.
+        fd = os.open(today_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            if os.fstat(fd).st_size:
+                content = "\n" + content
+            else:
+                # Add header for new day
+                content = f"# {self._today_str}\n\n" + content
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
     
     def read_long_term(self) -> str:
         """Read long-term memory (MEMORY.md)."""
-        if self.memory_file.exists():
-            return self.memory_file.read_text(encoding="utf-8")
-        return ""
+        return _read_text(self.memory_file)
     
     def write_long_term(self, content: str) -> None:
         """Write to long-term memory (MEMORY.md)."""
-        self.memory_file.write_text(content, encoding="utf-8")
+        _write_text(self.memory_file, content)
     
     def get_recent_memories(self, days: int = 7) -> str:
         """
@@ -65,19 +105,19 @@ class MemoryStore:
         Returns:
             Combined memory content.
         """
-        from datetime import timedelta
-        
         memories = []
         today = datetime.now().date()
         
+        # One directory listing instead of a stat per day in the window
+        with os.scandir(self.memory_dir) as it:
+            present = {e.name for e in it if e.is_file()}
+        
         for i in range(days):
             date = today - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-            file_path = self.memory_dir / f"{date_str}.md"
+            name = f"{date.strftime('%Y-%m-%d')}.md"
             
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                memories.append(content)
+            if name in present:
+                memories.append(_read_text(self.memory_dir / name))
         
         return "\n\n---\n\n".join(memories)
     
@@ -86,8 +126,15 @@ class MemoryStore:
         if not self.memory_dir.exists():
             return []
         
-        files = list(self.memory_dir.glob("????-??-??.md"))
-        return sorted(files, reverse=True)
+        # Filter on names only ("YYYY-MM-DD.md") and sort plain strings
+        with os.scandir(self.memory_dir) as it:
+            names = [
+                e.name for e in it
+                if len(e.name) == 13 and e.name.endswith(".md")
+                and e.name[4] == "-" and e.name[7] == "-" and e.is_file()
+            ]
+        names.sort(reverse=True)
+        return [self.memory_dir / name for name in names]
     
     def get_memory_context(self) -> str:
         """
@@ -122,8 +169,9 @@ class MemoryStore:
             realm: The detected realm ('assess', 'decide', or 'do').
         """
         timestamp = datetime.now().strftime("%H:%M")
-        realm_emoji = {"assess": "🔴", "decide": "🟠", "do": "🟢"}.get(realm.lower(), "⚪")
-        entry = f"- {timestamp} {realm_emoji} {realm.upper()}"
+        realm_low = realm.lower()
+        realm_emoji = _REALM_EMOJI.get(realm_low, _UNKNOWN_EMOJI)
+        entry = f"- {timestamp} {realm_emoji} {realm_low.upper()}"
         self.append_today(entry)
 
     def get_realm_summary(self) -> dict[str, int]:
@@ -133,17 +181,8 @@ class MemoryStore:
         Returns:
             Dict with realm counts: {'assess': N, 'decide': N, 'do': N}
         """
-        today_content = self.read_today()
-        counts = Counter()
-
-        # Match realm log entries: "- HH:MM 🔴 ASSESS" etc.
-        pattern = r"- \d{2}:\d{2} [🔴🟠🟢⚪] (ASSESS|DECIDE|DO)"
-        matches = re.findall(pattern, today_content)
-
-        for realm in matches:
-            counts[realm.lower()] += 1
-
-        return dict(counts)
+        matches = _REALM_RE.findall(_read_bytes(self.get_today_file()))
+        return dict(Counter(realm.decode("ascii").lower() for realm in matches))
 
     def get_realm_flow_summary(self) -> str:
         """
@@ -152,19 +191,20 @@ class MemoryStore:
         Returns:
             Formatted string like "Realm Flow: 60% Assess, 30% Do, 10% Decide"
         """
-        counts = self.get_realm_summary()
-        total = sum(counts.values())
+        # Single pass over today's notes into fixed slots (assess, decide, do)
+        counts = [0, 0, 0]
+        for m in _REALM_RE.finditer(_read_bytes(self.get_today_file())):
+            counts[_REALM_INDEX[m.group(1)]] += 1
+        total = sum(counts)
 
         if total == 0:
             return "No realm activity recorded today."
 
-        percentages = []
-        for realm in ["assess", "decide", "do"]:
-            count = counts.get(realm, 0)
-            pct = round(100 * count / total)
-            if pct > 0:
-                emoji = {"assess": "🔴", "decide": "🟠", "do": "🟢"}[realm]
-                percentages.append(f"{pct}% {emoji} {realm.capitalize()}")
+        percentages = [
+            f"{pct}% {emoji} {realm.capitalize()}"
+            for (realm, emoji), count in zip(_REALM_EMOJI.items(), counts)
+            if (pct := round(100 * count / total)) > 0
+        ]
 
         return "Realm Flow: " + ", ".join(percentages)
 
@@ -29,6 +29,7 @@ class ToolRegistry:
         self._audit = audit_logger or (AuditLogger() if enable_audit else None)
         self._sanitizer = sanitizer or (InputSanitizer() if enable_sanitization else None)
         self._context: dict[str, str] = {}  # user_id, channel, session_key
+        self._definitions_cache: list[dict[str, Any]] | None = None
 
     def set_context(
         self,
@@ -47,10 +48,12 @@ class ToolRegistry:
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._definitions_cache = None
     
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._tools.pop(name, None)
+        self._definitions_cache = None
     
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -61,8 +64,10 @@ class ToolRegistry:
         return name in self._tools
     
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """Get all tool definitions in OpenAI format (cached until tools change)."""
+        if self._definitions_cache is None:
+            self._definitions_cache = [tool.to_schema() for tool in self._tools.values()]
+        return list(self._definitions_cache)
     
     async def execute(self, name: str, params: dict[str, Any], allowed_dir: Path | None = None) -> str:
         """
@@ -112,7 +117,9 @@ class ToolRegistry:
             else:
                 result = await tool.execute(**clean_params)
 
-            self._log_tool_call(name, clean_params, success=True, result_preview=result)
+            # Hot path: skip the logging call entirely when audit is disabled
+            if self._audit:
+                self._log_tool_call(name, clean_params, success=True, result_preview=result)
             return result
         except Exception as e:
             error_msg = str(e)
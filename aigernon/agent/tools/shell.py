@@ -10,6 +10,14 @@ from loguru import logger
 
 from aigernon.agent.tools.base import Tool
 
+# Path extraction for the workspace restriction check
+_WIN_PATH_RE = re.compile(r"[A-Za-z]:\\[^\\\"']+")
+_POSIX_PATH_RE = re.compile(r"/[^\s\"']+")
+# Common system paths that are read-only and skipped by the workspace check
+_SYSTEM_PREFIXES = ("/usr/", "/bin/", "/opt/", "/etc/", "/tmp/")
+# Path traversal markers (../ or ..\) anywhere in the command
+_TRAVERSAL_RE = re.compile(r"\.\.[\\/]")
+
 
 class ExecTool(Tool):
     """Tool to execute shell commands with security controls."""
@@ -92,11 +100,32 @@ class ExecTool(Tool):
         # Allow patterns (regex)
         self.allow_patterns = allow_patterns or []
 
+        # Compile patterns once; _guard_command runs on every exec call.
+        # The built-in critical patterns are fused into a single alternation;
+        # user patterns are compiled on their own so inline flags and
+        # backreferences keep working.
+        self._critical_union = self._compile_union(self.CRITICAL_DENY_PATTERNS)
+        self._deny_res = [
+            re.compile(p) for p in self.deny_patterns if p not in self.CRITICAL_DENY_PATTERNS
+        ]
+        self._allow_res = [re.compile(p) for p in self.allow_patterns]
+
         # Allow prefixes (simple string matching, more intuitive)
         self.allow_prefixes = allow_prefixes if allow_prefixes is not None else self.DEFAULT_ALLOW_PREFIXES
+        self._allow_prefix_tuple = tuple(p.lower() for p in self.allow_prefixes)
 
         self.restrict_to_workspace = restrict_to_workspace
         self.extra_allowed_dirs = [str(Path(d).resolve()) for d in (extra_allowed_dirs or [])]
+        # Only the configured working_dir is resolved up front; per-call
+        # working_dir values are resolved fresh so symlink changes are seen
+        self._resolved_working_dir = Path(working_dir).resolve() if working_dir else None
+
+    @staticmethod
+    def _compile_union(patterns: list[str]) -> re.Pattern[str] | None:
+        """Compile a list of regexes into one alternation (None if empty)."""
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
 
     @property
     def name(self) -> str:
@@ -146,27 +175,31 @@ class ExecTool(Tool):
                 process.kill()
                 return f"Error: Command timed out after {self.timeout} seconds"
             
-            output_parts = []
+            # Assemble raw bytes and decode once, after truncation
+            output_parts: list[bytes] = []
             
             if stdout:
-                output_parts.append(stdout.decode("utf-8", errors="replace"))
+                output_parts.append(stdout)
             
-            if stderr:
-                stderr_text = stderr.decode("utf-8", errors="replace")
-                if stderr_text.strip():
-                    output_parts.append(f"STDERR:\n{stderr_text}")
+            if stderr and stderr.strip():
+                output_parts.append(b"STDERR:\n" + stderr)
             
             if process.returncode != 0:
-                output_parts.append(f"\nExit code: {process.returncode}")
+                output_parts.append(f"\nExit code: {process.returncode}".encode())
             
-            result = "\n".join(output_parts) if output_parts else "(no output)"
+            raw = b"\n".join(output_parts)
+            if not raw:
+                return "(no output)"
             
             # Truncate very long output
             max_len = 10000
-            if len(result) > max_len:
-                result = result[:max_len] + f"\n... (truncated, {len(result) - max_len} more chars)"
+            if len(raw) > max_len:
+                return (
+                    raw[:max_len].decode("utf-8", errors="replace")
+                    + f"\n... (truncated, {len(raw) - max_len} more bytes)"
+                )
             
-            return result
+            return raw.decode("utf-8", errors="replace")
             
         except Exception as e:
             return f"Error executing command: {str(e)}"
@@ -177,38 +210,29 @@ class ExecTool(Tool):
 
         Uses a combination of:
         1. Critical deny patterns (always blocked)
-        2. Allowlist (prefix or regex based)
-        3. Workspace restriction (optional)
+        2. Allowlist (prefix first, then regex)
+        3. Additional deny patterns
+        4. Workspace restriction (optional)
         """
         cmd = command.strip()
         lower = cmd.lower()
 
         # Step 1: Check critical deny patterns (always blocked)
-        for pattern in self.CRITICAL_DENY_PATTERNS:
-            if re.search(pattern, lower):
-                logger.warning(f"Command blocked (critical pattern): {cmd[:100]}")
-                return "Error: Command blocked by security guard (dangerous operation detected)"
-
-        # Step 2: Check additional deny patterns
-        for pattern in self.deny_patterns:
-            if pattern not in self.CRITICAL_DENY_PATTERNS and re.search(pattern, lower):
-                logger.warning(f"Command blocked (deny pattern): {cmd[:100]}")
-                return "Error: Command blocked by security guard (pattern denied)"
-
-        # Step 3: Allowlist check (if enabled)
-        if self.use_allowlist:
-            allowed = False
+        if self._critical_union.search(lower):
+            logger.warning(f"Command blocked (critical pattern): {cmd[:100]}")
+            return "Error: Command blocked by security guard (dangerous operation detected)"
 
+        # Step 2: Allowlist check (if enabled). The cheap prefix test runs
+        # before any further regex work; commands it rejects never reach the
+        # extended deny scan.
+        if self.use_allowlist:
             # Check prefix allowlist
-            for prefix in self.allow_prefixes:
-                if lower.startswith(prefix.lower()) or cmd.startswith(prefix):
-                    allowed = True
-                    break
+            allowed = lower.startswith(self._allow_prefix_tuple)
 
             # Check regex allow patterns
-            if not allowed and self.allow_patterns:
-                for pattern in self.allow_patterns:
-                    if re.search(pattern, lower):
+            if not allowed and self._allow_res:
+                for pattern in self._allow_res:
+                    if pattern.search(lower):
                         allowed = True
                         break
 
@@ -219,20 +243,29 @@ class ExecTool(Tool):
                     "Common operations like git, npm, python, grep, find, ls are permitted."
                 )
 
+        # Step 3: Check additional deny patterns (still applied to allowlisted
+        # commands so user rules can narrow broad prefixes such as "curl ")
+        if any(pattern.search(lower) for pattern in self._deny_res):
+            logger.warning(f"Command blocked (deny pattern): {cmd[:100]}")
+            return "Error: Command blocked by security guard (pattern denied)"
+
         # Step 4: Workspace restriction
         if self.restrict_to_workspace:
-            if "..\\" in cmd or "../" in cmd:
+            if _TRAVERSAL_RE.search(cmd):
                 return "Error: Command blocked by security guard (path traversal detected)"
 
-            cwd_path = Path(cwd).resolve()
+            if cwd == self.working_dir and self._resolved_working_dir is not None:
+                cwd_path = self._resolved_working_dir
+            else:
+                cwd_path = Path(cwd).resolve()
 
             # Extract paths from command
-            win_paths = re.findall(r"[A-Za-z]:\\[^\\\"']+", cmd)
-            posix_paths = re.findall(r"/[^\s\"']+", cmd)
+            win_paths = _WIN_PATH_RE.findall(cmd)
+            posix_paths = _POSIX_PATH_RE.findall(cmd)
 
             for raw in win_paths + posix_paths:
                 # Skip common system paths that are read-only
-                if raw.startswith(("/usr/", "/bin/", "/opt/", "/etc/", "/tmp/")):
+                if raw.startswith(_SYSTEM_PREFIXES):
                     continue
 
                 try:
@@ -36,6 +36,7 @@ class BaseChannel(ABC):
         self.config = config
         self.bus = bus
         self._running = False
+        self._allow_from = frozenset(getattr(config, "allow_from", None) or ())
 
         # Initialize shared rate limiter (once per class)
         if BaseChannel._rate_limiter is None:
@@ -82,20 +83,18 @@ class BaseChannel(ABC):
         Returns:
             True if allowed, False otherwise.
         """
-        allow_list = getattr(self.config, "allow_from", [])
+        allow_from = self._allow_from
         
         # If no allow list, allow everyone
-        if not allow_list:
+        if not allow_from:
             return True
         
-        sender_str = str(sender_id)
-        if sender_str in allow_list:
+        sender_str = sender_id if type(sender_id) is str else str(sender_id)
+        if sender_str in allow_from:
             return True
-        if "|" in sender_str:
-            for part in sender_str.split("|"):
-                if part and part in allow_list:
-                    return True
-        return False
+        if "|" not in sender_str:
+            return False
+        return any(part in allow_from for part in sender_str.split("|") if part)
     
     async def _handle_message(
         self,
@@ -117,10 +116,11 @@ class BaseChannel(ABC):
             media: Optional list of media URLs.
             metadata: Optional channel-specific metadata.
         """
-        sender_str = str(sender_id)
+        sender_str = sender_id if type(sender_id) is str else str(sender_id)
+        chat_str = chat_id if type(chat_id) is str else str(chat_id)
 
         # Check access permission
-        if not self.is_allowed(sender_id):
+        if not self.is_allowed(sender_str):
             logger.warning(
                 f"Access denied for sender {sender_id} on channel {self.name}. "
                 f"Add them to allowFrom list in config to grant access."
@@ -145,7 +145,7 @@ class BaseChannel(ABC):
         msg = InboundMessage(
             channel=self.name,
             sender_id=sender_str,
-            chat_id=str(chat_id),
+            chat_id=chat_str,
             content=content,
             media=media or [],
             metadata=metadata or {}
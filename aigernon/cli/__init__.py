@@ -1 +1,15 @@
 """CLI module for aigernon."""
+
+import sys
+
+
+def main() -> None:
+    """Console entry point."""
+    # `aigernon --version` is answered before Typer/Click build the command tree
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        from aigernon import __version__, __logo__
+        print(f"{__logo__} aigernon v{__version__}")
+        return
+
+    from aigernon.cli.commands import app
+    app()
@@ -1,5 +1,6 @@
 """Coaching data store for multi-client coaching support."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -8,6 +9,22 @@ import yaml
 
 from aigernon.utils.helpers import ensure_dir
 
+# Heading marker written for every emergency flag entry in flags.md
+_FLAG_MARKER = "🚨 FLAGGED"
+
+
+def _read_if_exists(path: Path) -> Optional[str]:
+    """Read a text file, returning None if it does not exist."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _count_flag_entries(flags: str) -> int:
+    """Count the flag entries in (possibly date-filtered) flags.md content."""
+    return flags.count(_FLAG_MARKER)
+
 
 class CoachingStore:
     """
@@ -17,6 +34,9 @@ class CoachingStore:
     session notes, and emergency flags.
     """
 
+    # Client count from which list_clients reads client files on a thread pool
+    _PARALLEL_READ_MIN = 8
+
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.coaching_dir = ensure_dir(workspace / "coaching")
@@ -102,12 +122,23 @@ class CoachingStore:
         if not self.coaching_dir.exists():
             return clients
 
-        for client_dir in self.coaching_dir.iterdir():
-            if client_dir.is_dir():
-                config_path = client_dir / "client.yaml"
-                if config_path.exists():
-                    config = yaml.safe_load(config_path.read_text())
-                    clients.append(config)
+        config_paths = [
+            client_dir / "client.yaml"
+            for client_dir in self.coaching_dir.iterdir()
+            if client_dir.is_dir()
+        ]
+
+        # Per-client reads are independent; overlap them once there are
+        # enough clients to pay for the threads (YAML parsing stays serial).
+        if len(config_paths) >= self._PARALLEL_READ_MIN:
+            with ThreadPoolExecutor(max_workers=min(32, len(config_paths))) as pool:
+                contents = list(pool.map(_read_if_exists, config_paths))
+        else:
+            contents = [_read_if_exists(path) for path in config_paths]
+
+        for content in contents:
+            if content is not None:
+                clients.append(yaml.safe_load(content))
 
         return clients
 
@@ -228,7 +259,7 @@ class CoachingStore:
         notified_str = "Yes" if coach_notified else "No"
 
         entry = f"""
-## {timestamp} 🚨 FLAGGED
+## {timestamp} {_FLAG_MARKER}
 
 Client message: "{message}"
 Grounding offered: {grounding_str}
@@ -268,8 +299,7 @@ Coach notified: {notified_str}
 
     def count_flags(self, client_id: str, since_date: Optional[datetime] = None) -> int:
         """Count emergency flags for a client."""
-        flags_content = self.get_flags(client_id, since_date)
-        return flags_content.count("🚨 FLAGGED")
+        return _count_flag_entries(self.get_flags(client_id, since_date))
 
     # -------------------------------------------------------------------------
     # Sessions
@@ -379,6 +409,28 @@ Coach notified: {notified_str}
         history_path = client_dir / "history.md"
         history_path.write_text(content)
 
+    def get_history_summary(self, client_id: str, since_date: Optional[datetime] = None) -> dict:
+        """
+        Get everything recorded for a client since a date.
+
+        Each file is read once; flags are counted from the same read.
+
+        Returns dict with:
+            - sessions: formatted summary of recent sessions
+            - ideas: ideas since the date
+            - questions: questions since the date
+            - flags: flags since the date
+            - flag_count: number of flags
+        """
+        flags = self.get_flags(client_id, since_date)
+        return {
+            "sessions": self.get_sessions_summary(client_id, since_date),
+            "ideas": self.get_ideas(client_id, since_date),
+            "questions": self.get_questions(client_id, since_date),
+            "flags": flags,
+            "flag_count": _count_flag_entries(flags),
+        }
+
     # -------------------------------------------------------------------------
     # Prep (Pre-session summary)
     # -------------------------------------------------------------------------
@@ -405,13 +457,14 @@ Coach notified: {notified_str}
         if last_session:
             since_date = datetime.strptime(last_session, "%Y-%m-%d")
 
+        flags = self.get_flags(client_id, since_date)
         return {
             "client": client,
             "last_session": last_session,
             "ideas": self.get_ideas(client_id, since_date),
             "questions": self.get_questions(client_id, since_date),
-            "flags": self.get_flags(client_id, since_date),
-            "flag_count": self.count_flags(client_id, since_date),
+            "flags": flags,
+            "flag_count": _count_flag_entries(flags),
             "history": self.get_history(client_id),
         }
 
@@ -6,6 +6,9 @@ from typing import Any
 
 from aigernon.config.schema import Config
 
+# (path, mtime_ns, size, config) of the last file load, see load_config
+_CONFIG_CACHE: tuple[Path, int, int, Config] | None = None
+
 
 def get_config_path() -> Path:
     """Get the default configuration file path."""
@@ -21,6 +24,11 @@ def get_data_dir() -> Path:
 def load_config(config_path: Path | None = None) -> Config:
     """
     Load configuration from file or create default.
+
+    The parsed file is reused until its mtime or size changes, so repeated
+    calls within a process (and in the long-running gateway) don't re-parse
+    and re-validate it. Each call returns its own deep copy, so callers may
+    modify the result without affecting later loads.
     
     Args:
         config_path: Optional path to config file. Uses default if not provided.
@@ -28,14 +36,25 @@ def load_config(config_path: Path | None = None) -> Config:
     Returns:
         Loaded configuration object.
     """
+    global _CONFIG_CACHE
     path = config_path or get_config_path()
-    
-    if path.exists():
+
+    try:
+        st = path.stat()
+    except OSError:
+        st = None
+
+    if st is not None:
+        cached = _CONFIG_CACHE
+        if cached and cached[0] == path and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+            return cached[3].model_copy(deep=True)
         try:
             with open(path) as f:
                 data = json.load(f)
             data = _migrate_config(data)
-            return Config.model_validate(convert_keys(data))
+            config = Config.model_validate(convert_keys(data))
+            _CONFIG_CACHE = (path, st.st_mtime_ns, st.st_size, config)
+            return config.model_copy(deep=True)
         except (json.JSONDecodeError, ValueError) as e:
             print(f"Warning: Failed to load config from {path}: {e}")
             print("Using default configuration.")
@@ -51,8 +70,10 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
         config: Configuration to save.
         config_path: Optional path to save to. Uses default if not provided.
     """
+    global _CONFIG_CACHE
     path = config_path or get_config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
+    _CONFIG_CACHE = None
     
     # Convert to camelCase format
     data = config.model_dump()
@@ -1,6 +1,8 @@
 """Configuration schema using Pydantic."""
 
 from pathlib import Path
+from typing import NamedTuple
+
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
@@ -77,6 +79,14 @@ class ProviderConfig(BaseModel):
     extra_headers: dict[str, str] | None = None  # Custom headers (e.g. APP-Code for AiHubMix)
 
 
+class ProviderCreds(NamedTuple):
+    """Provider settings resolved for one model in a single registry walk."""
+    api_key: str | None
+    api_base: str | None
+    extra_headers: dict[str, str] | None
+    provider_name: str | None
+
+
 class ProvidersConfig(BaseModel):
     """Configuration for LLM providers."""
     anthropic: ProviderConfig = Field(default_factory=ProviderConfig)
@@ -231,8 +241,22 @@ class Config(BaseSettings):
     
     def get_api_base(self, model: str | None = None) -> str | None:
         """Get API base URL for the given model. Applies default URLs for known gateways."""
-        from aigernon.providers.registry import find_by_name
+        return self._api_base_for(*self._match_provider(model))
+
+    def get_provider_creds(self, model: str | None = None) -> ProviderCreds:
+        """Get api_key, api_base, extra_headers and provider name with one provider match."""
         p, name = self._match_provider(model)
+        return ProviderCreds(
+            api_key=p.api_key if p else None,
+            api_base=self._api_base_for(p, name),
+            extra_headers=p.extra_headers if p else None,
+            provider_name=name,
+        )
+
+    @staticmethod
+    def _api_base_for(p: ProviderConfig | None, name: str | None) -> str | None:
+        """API base for a matched provider, defaulting for known gateways."""
+        from aigernon.providers.registry import find_by_name
         if p and p.api_base:
             return p.api_base
         # Only gateways get a default api_base here. Standard providers
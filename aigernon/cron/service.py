@@ -11,6 +11,12 @@ from loguru import logger
 
 from aigernon.cron.types import CronJob, CronJobState, CronPayload, CronSchedule, CronStore
 
+# orjson parses jobs.json considerably faster when installed; both accept bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
@@ -39,6 +45,65 @@ def _compute_next_run(schedule: CronSchedule, now_ms: int) -> int | None:
     return None
 
 
+def _job_from_dict(j: dict[str, Any]) -> CronJob:
+    """Build a CronJob from its jobs.json representation."""
+    return CronJob(
+        id=j["id"],
+        name=j["name"],
+        enabled=j.get("enabled", True),
+        schedule=CronSchedule(
+            kind=j["schedule"]["kind"],
+            at_ms=j["schedule"].get("atMs"),
+            every_ms=j["schedule"].get("everyMs"),
+            expr=j["schedule"].get("expr"),
+            tz=j["schedule"].get("tz"),
+        ),
+        payload=CronPayload(
+            kind=j["payload"].get("kind", "agent_turn"),
+            message=j["payload"].get("message", ""),
+            deliver=j["payload"].get("deliver", False),
+            channel=j["payload"].get("channel"),
+            to=j["payload"].get("to"),
+            deliver_channels=j["payload"].get("deliverChannels"),
+        ),
+        state=CronJobState(
+            next_run_at_ms=j.get("state", {}).get("nextRunAtMs"),
+            last_run_at_ms=j.get("state", {}).get("lastRunAtMs"),
+            last_status=j.get("state", {}).get("lastStatus"),
+            last_error=j.get("state", {}).get("lastError"),
+        ),
+        created_at_ms=j.get("createdAtMs", 0),
+        updated_at_ms=j.get("updatedAtMs", 0),
+        delete_after_run=j.get("deleteAfterRun", False),
+        instance_id=j.get("instanceId"),
+        user_id=j.get("userId"),
+    )
+
+
+def _read_jobs(store_path: Path) -> list[CronJob]:
+    """Read jobs.json with a single buffered read; empty list if missing or invalid."""
+    try:
+        with open(store_path, "rb", buffering=1 << 16) as f:
+            data = _json_loads(f.read())
+        return [_job_from_dict(j) for j in data.get("jobs", [])]
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        logger.warning(f"Failed to load cron store: {e}")
+        return []
+
+
+def _select_jobs(
+    jobs: list[CronJob], include_disabled: bool, instance_id: str | None
+) -> list[CronJob]:
+    """Filter jobs by enabled/instance and sort by next run."""
+    if not include_disabled:
+        jobs = [j for j in jobs if j.enabled]
+    if instance_id is not None:
+        jobs = [j for j in jobs if j.instance_id == instance_id]
+    return sorted(jobs, key=lambda j: j.state.next_run_at_ms or float('inf'))
+
+
 class CronService:
     """Service for managing and executing scheduled jobs."""
     
@@ -58,51 +123,23 @@ class CronService:
         if self._store:
             return self._store
         
-        if self.store_path.exists():
-            try:
-                data = json.loads(self.store_path.read_text())
-                jobs = []
-                for j in data.get("jobs", []):
-                    jobs.append(CronJob(
-                        id=j["id"],
-                        name=j["name"],
-                        enabled=j.get("enabled", True),
-                        schedule=CronSchedule(
-                            kind=j["schedule"]["kind"],
-                            at_ms=j["schedule"].get("atMs"),
-                            every_ms=j["schedule"].get("everyMs"),
-                            expr=j["schedule"].get("expr"),
-                            tz=j["schedule"].get("tz"),
-                        ),
-                        payload=CronPayload(
-                            kind=j["payload"].get("kind", "agent_turn"),
-                            message=j["payload"].get("message", ""),
-                            deliver=j["payload"].get("deliver", False),
-                            channel=j["payload"].get("channel"),
-                            to=j["payload"].get("to"),
-                            deliver_channels=j["payload"].get("deliverChannels"),
-                        ),
-                        state=CronJobState(
-                            next_run_at_ms=j.get("state", {}).get("nextRunAtMs"),
-                            last_run_at_ms=j.get("state", {}).get("lastRunAtMs"),
-                            last_status=j.get("state", {}).get("lastStatus"),
-                            last_error=j.get("state", {}).get("lastError"),
-                        ),
-                        created_at_ms=j.get("createdAtMs", 0),
-                        updated_at_ms=j.get("updatedAtMs", 0),
-                        delete_after_run=j.get("deleteAfterRun", False),
-                        instance_id=j.get("instanceId"),
-                        user_id=j.get("userId"),
-                    ))
-                self._store = CronStore(jobs=jobs)
-            except Exception as e:
-                logger.warning(f"Failed to load cron store: {e}")
-                self._store = CronStore()
-        else:
-            self._store = CronStore()
-        
+        self._store = CronStore(jobs=_read_jobs(self.store_path))
         return self._store
     
+    @staticmethod
+    def read_jobs(
+        store_path: Path,
+        include_disabled: bool = False,
+        instance_id: str | None = None,
+    ) -> list[CronJob]:
+        """
+        Read-only listing straight from disk.
+        
+        Same result as ``list_jobs`` without building a service, for callers
+        (like ``aigernon cron list``) that never modify or run jobs.
+        """
+        return _select_jobs(_read_jobs(store_path), include_disabled, instance_id)
+    
     def _save_store(self) -> None:
         """Save jobs to disk."""
         if not self._store:
@@ -256,11 +293,7 @@ class CronService:
     
     def list_jobs(self, include_disabled: bool = False, instance_id: str | None = None) -> list[CronJob]:
         """List jobs, optionally filtered by instance."""
-        store = self._load_store()
-        jobs = store.jobs if include_disabled else [j for j in store.jobs if j.enabled]
-        if instance_id is not None:
-            jobs = [j for j in jobs if j.instance_id == instance_id]
-        return sorted(jobs, key=lambda j: j.state.next_run_at_ms or float('inf'))
+        return _select_jobs(self._load_store().jobs, include_disabled, instance_id)
     
     def add_job(
         self,
@@ -277,9 +310,51 @@ class CronService:
     ) -> CronJob:
         """Add a new job."""
         store = self._load_store()
-        now = _now_ms()
+        job = self._build_job(
+            name, schedule, message, deliver=deliver, channel=channel, to=to,
+            deliver_channels=deliver_channels, delete_after_run=delete_after_run,
+            instance_id=instance_id, user_id=user_id,
+        )
+        
+        store.jobs.append(job)
+        self._save_store()
+        self._arm_timer()
+        
+        logger.info(f"Cron: added job '{name}' ({job.id})")
+        return job
+    
+    def add_jobs(self, jobs: list[dict[str, Any]]) -> list[CronJob]:
+        """
+        Add several jobs with a single store write.
         
-        job = CronJob(
+        Each item holds the keyword arguments of add_job().
+        """
+        store = self._load_store()
+        added = [self._build_job(**spec) for spec in jobs]
+        
+        store.jobs.extend(added)
+        self._save_store()
+        self._arm_timer()
+        
+        logger.info(f"Cron: added {len(added)} jobs")
+        return added
+    
+    @staticmethod
+    def _build_job(
+        name: str,
+        schedule: CronSchedule,
+        message: str,
+        deliver: bool = False,
+        channel: str | None = None,
+        to: str | None = None,
+        deliver_channels: list[str] | None = None,
+        delete_after_run: bool = False,
+        instance_id: str | None = None,
+        user_id: str | None = None,
+    ) -> CronJob:
+        """Create a new enabled job with its first run computed."""
+        now = _now_ms()
+        return CronJob(
             id=str(uuid.uuid4())[:8],
             name=name,
             enabled=True,
@@ -299,13 +374,6 @@ class CronService:
             instance_id=instance_id,
             user_id=user_id,
         )
-        
-        store.jobs.append(job)
-        self._save_store()
-        self._arm_timer()
-        
-        logger.info(f"Cron: added job '{name}' ({job.id})")
-        return job
     
     def update_job(
         self,
@@ -77,11 +77,12 @@ class HealthCheck:
         pid = daemon_status.read_pid()
 
         if pid and daemon_status.is_process_running(pid):
-            uptime = daemon_status.get_uptime() or "unknown"
+            status = daemon_status.read_status()
+            uptime = daemon_status.get_uptime(status) or "unknown"
             self._add("ok", f"Daemon is running (PID {pid}, uptime {uptime})")
 
             # Check heartbeat
-            age = daemon_status.get_heartbeat_age()
+            age = daemon_status.get_heartbeat_age(status)
             if age is not None:
                 if age < 120:  # 2 minutes
                     self._add("ok", f"Last heartbeat: {age} seconds ago")
@@ -361,10 +361,12 @@ class DaemonManager:
         if pid and self.status.is_process_running(pid):
             result["running"] = True
             result["pid"] = pid
-            result["uptime"] = self.status.get_uptime()
-            result["last_heartbeat"] = self.status.get_heartbeat_age()
 
+            # One read of the status file feeds uptime, heartbeat and counters
             status_data = self.status.read_status()
+            result["uptime"] = self.status.get_uptime(status_data)
+            result["last_heartbeat"] = self.status.get_heartbeat_age(status_data)
+
             if status_data:
                 result["channels_active"] = status_data.get("channels_active", [])
                 result["sessions_active"] = status_data.get("sessions_active", 0)
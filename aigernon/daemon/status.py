@@ -37,8 +37,6 @@ class DaemonStatus:
         Returns:
             PID if file exists and is readable, None otherwise.
         """
-        if not self.pid_file.exists():
-            return None
         try:
             return int(self.pid_file.read_text().strip())
         except (ValueError, OSError):
@@ -113,9 +111,6 @@ class DaemonStatus:
         Returns:
             Status dict if file exists and is readable, None otherwise.
         """
-        if not self.status_file.exists():
-            return None
-
         try:
             return json.loads(self.status_file.read_text())
         except (json.JSONDecodeError, OSError):
@@ -210,14 +205,18 @@ class DaemonStatus:
             self._heartbeat_task.cancel()
             self._heartbeat_task = None
 
-    def get_uptime(self) -> str | None:
+    def get_uptime(self, status: dict[str, Any] | None = None) -> str | None:
         """
         Get human-readable uptime.
 
+        Args:
+            status: Status dict already read by the caller. Read from file if not provided.
+
         Returns:
             Uptime string (e.g., "2h 15m") or None if not running.
         """
-        status = self.read_status()
+        if status is None:
+            status = self.read_status()
         if status is None or not status.get("started_at"):
             return None
 
@@ -237,14 +236,18 @@ class DaemonStatus:
         except (ValueError, KeyError):
             return None
 
-    def get_heartbeat_age(self) -> int | None:
+    def get_heartbeat_age(self, status: dict[str, Any] | None = None) -> int | None:
         """
         Get seconds since last heartbeat.
 
+        Args:
+            status: Status dict already read by the caller. Read from file if not provided.
+
         Returns:
             Seconds since last heartbeat, or None if unknown.
         """
-        status = self.read_status()
+        if status is None:
+            status = self.read_status()
         if status is None or not status.get("last_heartbeat"):
             return None
 
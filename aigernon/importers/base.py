@@ -35,6 +35,10 @@ class BaseImporter(ABC):
     and index them into the vector store.
     """
 
+    # Chunks from several documents are buffered up to this many and indexed
+    # in one vector store call, i.e. one embedding request
+    INDEX_BATCH_SIZE = 256
+
     def __init__(
         self,
         vector_store: VectorStore,
@@ -55,6 +59,8 @@ class BaseImporter(ABC):
         self.collection = collection
         self.chunker = chunker or TextChunker()
         self.on_progress = on_progress
+        self._batch: list[tuple[str, list[Any], str]] = []
+        self._batch_chunks = 0
 
     def _report_progress(self, current: int, total: int, message: str) -> None:
         """Report progress if callback is set."""
@@ -105,3 +111,62 @@ class BaseImporter(ABC):
         )
 
         return len(chunks)
+
+    def _queue_chunks(
+        self,
+        result: ImportResult,
+        label: str,
+        chunks: list[Any],
+        base_id: str,
+    ) -> None:
+        """
+        Buffer a document's chunks, indexing the buffer once it is full.
+
+        Counts in result are updated when the buffer is flushed. Callers must
+        call _flush_chunks once all documents have been queued.
+
+        Args:
+            result: ImportResult to record counts and errors in
+            label: Document name used in error messages
+            chunks: List of Chunk objects
+            base_id: Base ID for generating chunk IDs
+        """
+        self._batch.append((label, chunks, base_id))
+        self._batch_chunks += len(chunks)
+        if self._batch_chunks >= self.INDEX_BATCH_SIZE:
+            self._flush_chunks(result)
+
+    def _flush_chunks(self, result: ImportResult) -> None:
+        """Index all buffered chunks in a single vector store call."""
+        batch, self._batch, self._batch_chunks = self._batch, [], 0
+        if not batch:
+            return
+
+        chunks = [chunk for _, doc_chunks, _ in batch for chunk in doc_chunks]
+        ids = [
+            f"{base_id}_chunk_{chunk.index}"
+            for _, doc_chunks, base_id in batch
+            for chunk in doc_chunks
+        ]
+
+        try:
+            if chunks:
+                self.vector_store.add(
+                    collection=self.collection,
+                    documents=[chunk.text for chunk in chunks],
+                    metadatas=[chunk.metadata for chunk in chunks],
+                    ids=ids,
+                )
+        except Exception:
+            # Fall back to one call per document so a single bad document
+            # is reported on its own instead of failing the whole batch
+            for label, doc_chunks, base_id in batch:
+                try:
+                    result.chunks_created += self._index_chunks(doc_chunks, base_id)
+                    result.documents_processed += 1
+                except Exception as e:
+                    result.errors.append(f"{label}: {str(e)}")
+            return
+
+        result.documents_processed += len(batch)
+        result.chunks_created += len(chunks)
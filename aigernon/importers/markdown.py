@@ -1,6 +1,9 @@
 """Markdown folder importer."""
 
+import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -8,6 +11,11 @@ from aigernon.importers.base import BaseImporter, ImportResult
 from aigernon.memory.vector import VectorStore
 from aigernon.memory.chunker import TextChunker
 
+# "**/*.md"-style patterns, walked with os.scandir instead of Path.glob
+_RECURSIVE_SUFFIX_RE = re.compile(r"\*\*/\*([^*?\[\]/]+)")
+# "**/node_modules/**"-style excludes, applied by not descending into the directory
+_EXCLUDED_DIR_RE = re.compile(r"\*\*/([^*?\[\]/]+)/\*\*")
+
 
 class MarkdownImporter(BaseImporter):
     """
@@ -19,6 +27,11 @@ class MarkdownImporter(BaseImporter):
     - Various markdown flavors
     """
 
+    # Files read and chunked ahead of the one being indexed, and the number
+    # of threads doing the reading (reads in flight at once)
+    PREFETCH = 16
+    READ_WORKERS = 4
+
     def __init__(
         self,
         vector_store: VectorStore,
@@ -55,20 +68,7 @@ class MarkdownImporter(BaseImporter):
         exclude_patterns = exclude_patterns or []
 
         # Find all matching files
-        files = list(path.glob(pattern))
-
-        # Filter out excluded patterns
-        if exclude_patterns:
-            filtered_files = []
-            for f in files:
-                excluded = False
-                for exclude in exclude_patterns:
-                    if f.match(exclude):
-                        excluded = True
-                        break
-                if not excluded:
-                    filtered_files.append(f)
-            files = filtered_files
+        files = self._find_files(path, pattern, exclude_patterns)
 
         if not files:
             return ImportResult(
@@ -80,27 +80,86 @@ class MarkdownImporter(BaseImporter):
         result = ImportResult(success=True)
         total = len(files)
 
-        for i, file_path in enumerate(files):
-            self._report_progress(i + 1, total, f"Processing {file_path.name}")
+        # Reading and chunking upcoming files (disk) runs on worker threads
+        # while the current file is indexed (embedding API round-trips). The
+        # window is bounded so large trees aren't held in memory at once.
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as pool:
+            pending = deque(
+                (file_path, pool.submit(self._prepare_file, file_path))
+                for file_path in files[:self.PREFETCH]
+            )
+            upcoming = iter(files[self.PREFETCH:])
+
+            for i in range(total):
+                file_path, prepared = pending.popleft()
+                next_path = next(upcoming, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(self._prepare_file, next_path)))
+
+                self._report_progress(i + 1, total, f"Processing {file_path.name}")
 
-            try:
-                chunks_created = self._import_file(file_path)
-                result.documents_processed += 1
-                result.chunks_created += chunks_created
-            except Exception as e:
-                result.errors.append(f"{file_path.name}: {str(e)}")
+                try:
+                    self._queue_chunks(result, file_path.name, *prepared.result())
+                except Exception as e:
+                    result.errors.append(f"{file_path.name}: {str(e)}")
 
+        self._flush_chunks(result)
         return result
 
-    def _import_file(self, file_path: Path) -> int:
+    def _find_files(self, path: Path, pattern: str, exclude_patterns: list[str]) -> list[Path]:
         """
-        Import a single markdown file.
+        Find files under path matching pattern, minus excluded ones.
+
+        Recursive suffix patterns (the default "**/*.md") are walked with
+        os.scandir, which answers is_dir/is_file from the directory listing
+        and skips excluded directories entirely instead of filtering every
+        file found inside them. Other patterns fall back to Path.glob.
+        """
+        match = _RECURSIVE_SUFFIX_RE.fullmatch(pattern)
+        if match is None:
+            candidates = path.glob(pattern)
+        else:
+            skip_dirs = set()
+            remaining = []
+            for exclude in exclude_patterns:
+                dir_match = _EXCLUDED_DIR_RE.fullmatch(exclude)
+                if dir_match:
+                    skip_dirs.add(dir_match.group(1))
+                else:
+                    remaining.append(exclude)
+            exclude_patterns = remaining
+            candidates = map(Path, self._walk(str(path), match.group(1), skip_dirs))
+
+        return [
+            f for f in candidates
+            if not any(f.match(exclude) for exclude in exclude_patterns)
+        ]
+
+    @staticmethod
+    def _walk(directory: str, suffix: str, skip_dirs: set[str]):
+        """Yield paths of files ending in suffix, recursing into subdirectories."""
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        yield from MarkdownImporter._walk(entry.path, suffix, skip_dirs)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield entry.path
+
+    def _prepare_file(self, file_path: Path) -> tuple[list, str]:
+        """
+        Read and chunk a single markdown file.
 
         Args:
             file_path: Path to the markdown file
 
         Returns:
-            Number of chunks created
+            Tuple of (chunks, base_id) ready for indexing
         """
         content = file_path.read_text(encoding="utf-8")
 
@@ -130,7 +189,7 @@ class MarkdownImporter(BaseImporter):
         file_hash = hashlib.sha256(str(file_path).encode()).hexdigest()[:12]
         base_id = f"md_{file_hash}"
 
-        return self._index_chunks(chunks, base_id)
+        return chunks, base_id
 
     def _parse_frontmatter(self, content: str) -> tuple[dict, str]:
         """
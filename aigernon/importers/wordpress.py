@@ -88,9 +88,9 @@ class WordPressImporter(BaseImporter):
                         break
 
                     try:
-                        chunks_created = self._import_post(post)
-                        result.documents_processed += 1
-                        result.chunks_created += chunks_created
+                        self._queue_chunks(
+                            result, post.get("slug", "unknown"), *self._prepare_post(post)
+                        )
                         posts_imported += 1
 
                         self._report_progress(
@@ -110,6 +110,7 @@ class WordPressImporter(BaseImporter):
 
                 cursor = next_cursor
 
+        self._flush_chunks(result)
         return result
 
     async def _fetch_posts(
@@ -197,9 +198,24 @@ class WordPressImporter(BaseImporter):
         Returns:
             Number of chunks created
         """
+        return self._index_chunks(*self._prepare_post(post))
+
+    def _prepare_post(self, post: dict) -> tuple[list, str]:
+        """
+        Chunk a single WordPress post.
+
+        Args:
+            post: Post data from GraphQL
+
+        Returns:
+            Tuple of (chunks, base_id) ready for indexing
+        """
+        # Generate stable ID from post ID
+        base_id = f"wp_{post.get('databaseId', post.get('slug', 'unknown'))}"
+
         content = post.get("content", "")
         if not content:
-            return 0
+            return [], base_id
 
         # Extract categories and tags
         categories = [
@@ -234,10 +250,7 @@ class WordPressImporter(BaseImporter):
             categories=categories,
         )
 
-        # Generate stable ID from post ID
-        base_id = f"wp_{post.get('databaseId', post.get('slug', 'unknown'))}"
-
-        return self._index_chunks(chunks, base_id)
+        return chunks, base_id
 
     def import_post(
         self,
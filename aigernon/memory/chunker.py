@@ -214,6 +214,9 @@ class TextChunker:
 
         merged = []
         buffer_chunk = None
+        # Word counts add up across a whitespace join, so the buffer's count
+        # is carried along instead of re-splitting the growing merged text
+        buffer_words = 0
 
         for chunk in chunks:
             word_count = len(chunk.text.split())
@@ -221,25 +224,27 @@ class TextChunker:
             if buffer_chunk is None:
                 if word_count < self.min_chunk_size:
                     buffer_chunk = chunk
+                    buffer_words = word_count
                 else:
                     merged.append(chunk)
             else:
                 # Merge with buffer
-                combined_text = buffer_chunk.text + "\n\n" + chunk.text
-                combined_words = len(combined_text.split())
+                combined_words = buffer_words + word_count
 
                 if combined_words <= self.chunk_size:
                     # Keep merging
                     buffer_chunk = Chunk(
-                        text=combined_text,
+                        text=buffer_chunk.text + "\n\n" + chunk.text,
                         index=buffer_chunk.index,
                         metadata=buffer_chunk.metadata,
                     )
+                    buffer_words = combined_words
                 else:
                     # Flush buffer and start new one
                     merged.append(buffer_chunk)
                     if word_count < self.min_chunk_size:
                         buffer_chunk = chunk
+                        buffer_words = word_count
                     else:
                         merged.append(chunk)
                         buffer_chunk = None
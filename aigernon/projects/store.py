@@ -1,5 +1,6 @@
 """Project store for iOS app development with ADD workflow."""
 
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -8,6 +9,16 @@ import yaml
 
 from aigernon.utils.helpers import ensure_dir, safe_filename
 
+# Parse with libyaml's C loader when PyYAML was built with it. Dumping stays
+# on the pure-Python emitter, whose line folding differs slightly from the C
+# one, so files on disk keep their existing formatting.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_load(text: str):
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(text, Loader=_YAML_LOADER)
+
 
 class ProjectStore:
     """
@@ -43,6 +54,22 @@ class ProjectStore:
         ensure_dir(project_dir / "versions")
         return project_dir
 
+    @staticmethod
+    def _list_names(directory: Path, suffix: str) -> list[str]:
+        """
+        List sorted names of regular files in a directory with a suffix.
+
+        One scandir pass with no per-entry stat; empty if the directory
+        doesn't exist.
+        """
+        try:
+            with os.scandir(directory) as it:
+                names = [e.name for e in it if e.name.endswith(suffix) and e.is_file()]
+        except FileNotFoundError:
+            return []
+        names.sort()
+        return names
+
     def _idea_path(self, idea_id: str) -> Path:
         """Get the path for a specific idea."""
         safe_id = safe_filename(idea_id)
@@ -107,11 +134,16 @@ class ProjectStore:
         Returns:
             dict with 'id', 'title', 'items', or None if not found
         """
-        idea_path = self._idea_path(idea_id)
-        if not idea_path.exists():
+        try:
+            content = self._idea_path(idea_id).read_text()
+        except FileNotFoundError:
             return None
 
-        content = idea_path.read_text()
+        return self._parse_idea(idea_id, content)
+
+    @staticmethod
+    def _parse_idea(idea_id: str, content: str) -> dict:
+        """Parse an idea markdown file into 'id', 'title', 'items'."""
         lines = content.strip().split("\n")
 
         # Extract title from first line
@@ -134,13 +166,9 @@ class ProjectStore:
         """List all ideas."""
         ideas = []
 
-        if not self.ideas_dir.exists():
-            return ideas
-
-        for idea_file in sorted(self.ideas_dir.glob("*.md")):
-            idea = self.get_idea(idea_file.stem)
-            if idea:
-                ideas.append(idea)
+        for name in self._list_names(self.ideas_dir, ".md"):
+            content = (self.ideas_dir / name).read_text()
+            ideas.append(self._parse_idea(name[:-3], content))
 
         return ideas
 
@@ -148,6 +176,15 @@ class ProjectStore:
         """
         Add an item to an idea.
 
+        Returns:
+            True if successful, False if idea not found
+        """
+        return self.add_idea_items(idea_id, [item])
+
+    def add_idea_items(self, idea_id: str, items: list[str]) -> bool:
+        """
+        Add several items to an idea with a single rewrite of its file.
+
         Returns:
             True if successful, False if idea not found
         """
@@ -156,10 +193,10 @@ class ProjectStore:
             return False
 
         content = idea_path.read_text()
-        # Ensure newline before adding item
+        # Ensure newline before adding items
         if not content.endswith("\n"):
             content += "\n"
-        content += f"- {item}\n"
+        content += "".join(f"- {item}\n" for item in items)
         idea_path.write_text(content)
 
         return True
@@ -233,13 +270,7 @@ class ProjectStore:
         project_id = self.add_project(idea["title"], repo)
 
         # Create tasks from items
-        for item in idea["items"]:
-            self.add_task(
-                project_id=project_id,
-                title=item,
-                description="",
-                task_type="feature",
-            )
+        self.add_tasks(project_id, [{"title": item} for item in idea["items"]])
 
         # Delete the idea
         self.delete_idea(idea_id)
@@ -284,13 +315,13 @@ class ProjectStore:
 
     def get_project(self, project_id: str) -> Optional[dict]:
         """Get project configuration."""
-        project_dir = self._project_dir(project_id)
-        config_path = project_dir / "project.yaml"
+        config_path = self._project_dir(project_id) / "project.yaml"
 
-        if not config_path.exists():
+        try:
+            config = _yaml_load(config_path.read_text())
+        except FileNotFoundError:
             return None
 
-        config = yaml.safe_load(config_path.read_text())
         config["id"] = project_id
         return config
 
@@ -306,24 +337,31 @@ class ProjectStore:
         """
         projects = []
 
-        if not self.projects_dir.exists():
+        try:
+            with os.scandir(self.projects_dir) as it:
+                project_names = sorted(e.name for e in it if e.is_dir())
+        except FileNotFoundError:
             return projects
 
-        for project_dir in sorted(self.projects_dir.iterdir()):
-            if project_dir.is_dir():
-                config_path = project_dir / "project.yaml"
-                if config_path.exists():
-                    config = yaml.safe_load(config_path.read_text())
-                    config["id"] = project_dir.name
-                    tasks_dir = project_dir / "tasks"
-                    config["task_count"] = len(list(tasks_dir.glob("*.yaml"))) if tasks_dir.exists() else 0
+        for name in project_names:
+            project_dir = self.projects_dir / name
+            try:
+                config = _yaml_load((project_dir / "project.yaml").read_text())
+            except FileNotFoundError:
+                continue
+
+            # Filter before counting tasks so skipped projects cost one read
+            if realm is not None and config.get("realm") != realm:
+                continue
+
+            config["id"] = name
+            config["task_count"] = len(self._list_names(project_dir / "tasks", ".yaml"))
 
-                    # Backward-compat: collections projects without collection_id default to "done"
-                    if config.get("realm") == "collections" and not config.get("collection_id"):
-                        config["collection_id"] = "done"
+            # Backward-compat: collections projects without collection_id default to "done"
+            if config.get("realm") == "collections" and not config.get("collection_id"):
+                config["collection_id"] = "done"
 
-                    if realm is None or config.get("realm") == realm:
-                        projects.append(config)
+            projects.append(config)
 
         return projects
 
@@ -353,6 +391,7 @@ class ProjectStore:
         title: str,
         description: str,
         task_type: str = "feature",
+        project: Optional[dict] = None,
     ) -> Optional[str]:
         """
         Add a task to a project.
@@ -364,41 +403,77 @@ class ProjectStore:
             title: Task title
             description: Task description
             task_type: "feature" or "bug"
+            project: Project record already loaded by the caller, if any
 
         Returns:
             task_id if successful, None if project not found or not in Assess
         """
-        project = self.get_project(project_id)
-        if not project:
-            return None
+        task_ids = self.add_tasks(
+            project_id,
+            [{"title": title, "description": description, "type": task_type}],
+            project=project,
+        )
+        return task_ids[0] if task_ids else None
 
-        if project.get("realm") != "assess":
-            return None  # Can only add tasks in Assess
+    def add_tasks(
+        self,
+        project_id: str,
+        tasks: list[dict],
+        project: Optional[dict] = None,
+    ) -> Optional[list[str]]:
+        """
+        Add several tasks to a project at once.
 
-        if task_type not in self.TASK_TYPES:
-            task_type = "feature"
+        The project is checked and the tasks directory scanned for the next
+        ID once for the whole batch, rather than once per task.
 
-        task_id = self._generate_task_id(project_id)
+        Args:
+            project_id: Project to add tasks to
+            tasks: Dicts with 'title' and optional 'description' and 'type'
+            project: Project record already loaded by the caller, if any
 
-        task = {
-            "id": task_id,
-            "title": title,
-            "description": description,
-            "type": task_type,
-            "status": "draft",
-            "version": None,
-            "branch": None,
-            "execution_log": None,
-            "created_at": datetime.now().isoformat(),
-            "scheduled_at": None,
-            "started_at": None,
-            "completed_at": None,
-        }
+        Returns:
+            List of new task_ids, or None if project not found or not in Assess
+        """
+        if project is None:
+            project = self.get_project(project_id)
+        if not project:
+            return None
 
-        task_path = self._task_path(project_id, task_id)
-        task_path.write_text(yaml.dump(task, default_flow_style=False))
+        if project.get("realm") != "assess":
+            return None  # Can only add tasks in Assess
 
-        return task_id
+        next_num = int(self._generate_task_id(project_id))
+        task_ids = []
+
+        for item in tasks:
+            task_type = item.get("type", "feature")
+            if task_type not in self.TASK_TYPES:
+                task_type = "feature"
+
+            task_id = f"{next_num:03d}"
+            next_num += 1
+
+            task = {
+                "id": task_id,
+                "title": item["title"],
+                "description": item.get("description", ""),
+                "type": task_type,
+                "status": "draft",
+                "version": None,
+                "branch": None,
+                "execution_log": None,
+                "created_at": datetime.now().isoformat(),
+                "scheduled_at": None,
+                "started_at": None,
+                "completed_at": None,
+            }
+
+            task_path = self._task_path(project_id, task_id)
+            task_path.write_text(yaml.dump(task, default_flow_style=False))
+            task_ids.append(task_id)
+
+        return task_ids
 
     def get_task(self, project_id: str, task_id: str) -> Optional[dict]:
         """Get a task by ID."""
@@ -406,11 +481,45 @@ class ProjectStore:
         if not task_path.exists():
             return None
 
-        task = yaml.safe_load(task_path.read_text())
+        task = _yaml_load(task_path.read_text())
         if task and "id" not in task:
             task["id"] = task_id
         return task
 
+    def get_tasks(self, project_id: str, task_ids: list[str]) -> dict[str, dict]:
+        """
+        Get several tasks of a project at once.
+
+        Lists the tasks directory once instead of probing each path.
+
+        Args:
+            project_id: Project ID
+            task_ids: Task IDs to fetch
+
+        Returns:
+            Dict of task_id -> task for the IDs that exist
+        """
+        tasks_dir = self._project_dir(project_id) / "tasks"
+        wanted = {f"{task_id}.yaml": task_id for task_id in task_ids}
+        tasks = {}
+
+        try:
+            with os.scandir(tasks_dir) as it:
+                names = [e.name for e in it if e.name in wanted]
+        except FileNotFoundError:
+            return tasks
+
+        for name in names:
+            task = _yaml_load((tasks_dir / name).read_text())
+            if not task:
+                continue
+            task_id = wanted[name]
+            if "id" not in task:
+                task["id"] = task_id
+            tasks[task_id] = task
+
+        return tasks
+
     def list_tasks(
         self,
         project_id: str,
@@ -431,19 +540,25 @@ class ProjectStore:
         tasks = []
         tasks_dir = self._project_dir(project_id) / "tasks"
 
-        if not tasks_dir.exists():
-            return tasks
+        # Values that YAML always writes verbatim can rule a file out with a
+        # substring test on the raw text, before paying for a YAML parse.
+        # A backslash may be a double-quoted escape hiding the value, so
+        # such files are always parsed.
+        needles = [v for v in (status, version) if v and self._is_verbatim_scalar(v)]
 
-        for task_file in sorted(tasks_dir.glob("*.yaml")):
+        for name in self._list_names(tasks_dir, ".yaml"):
             try:
-                task = yaml.safe_load(task_file.read_text())
+                text = (tasks_dir / name).read_text()
+                if needles and "\\" not in text and not all(n in text for n in needles):
+                    continue
+                task = _yaml_load(text)
             except Exception:
                 continue
             if not task:
                 continue
             # Ensure id is always present (guard against agent-written files)
             if "id" not in task:
-                task["id"] = task_file.stem
+                task["id"] = name[:-5]
 
             if status and task.get("status") != status:
                 continue
@@ -454,6 +569,11 @@ class ProjectStore:
 
         return tasks
 
+    @staticmethod
+    def _is_verbatim_scalar(value: str) -> bool:
+        """Check that a string value appears literally in any YAML dump of it (no escaping or folding)."""
+        return value.isascii() and value.isprintable() and not any(c in value for c in " '\"\\")
+
     def update_task(self, project_id: str, task_id: str, **fields) -> bool:
         """
         Update task fields.
@@ -466,9 +586,13 @@ class ProjectStore:
             return False
 
         task.update(fields)
+        self._write_task(project_id, task_id, task)
+        return True
+
+    def _write_task(self, project_id: str, task_id: str, task: dict) -> None:
+        """Persist an already-loaded task dict."""
         task_path = self._task_path(project_id, task_id)
         task_path.write_text(yaml.dump(task, default_flow_style=False))
-        return True
 
     def delete_task(self, project_id: str, task_id: str) -> bool:
         """
@@ -515,36 +639,40 @@ class ProjectStore:
         source_path.unlink()
         return True
 
-    def mark_task_ready(self, project_id: str, task_id: str) -> bool:
+    def mark_task_ready(self, project_id: str, task_id: str) -> Optional[dict]:
         """
         Mark a task as ready (done defining).
 
         Only allowed in Assess realm, moves from draft to ready.
+        Returns the updated task, or None if the transition is not allowed.
         """
         project = self.get_project(project_id)
         if not project or project.get("realm") != "assess":
-            return False
+            return None
 
         task = self.get_task(project_id, task_id)
         if not task or task.get("status") not in ("draft", "unscheduled"):
-            return False
+            return None
 
-        return self.update_task(project_id, task_id, status="ready")
+        task["status"] = "ready"
+        self._write_task(project_id, task_id, task)
+        return task
 
-    def schedule_task(self, project_id: str, task_id: str, version: str) -> bool:
+    def schedule_task(self, project_id: str, task_id: str, version: str) -> Optional[dict]:
         """
         Schedule a task (assign to version).
 
         Only allowed in Decide realm.
         Creates version if it doesn't exist.
+        Returns the updated task, or None if the transition is not allowed.
         """
         project = self.get_project(project_id)
         if not project or project.get("realm") != "decide":
-            return False
+            return None
 
         task = self.get_task(project_id, task_id)
         if not task or task.get("status") != "unscheduled":
-            return False
+            return None
 
         # Create version if it doesn't exist
         version_data = self.get_version(project_id, version)
@@ -561,29 +689,30 @@ class ProjectStore:
         # Derive the shared version branch name (created by route handler)
         version_branch = f"version/{version}"
 
-        return self.update_task(
-            project_id,
-            task_id,
+        task.update(
             status="scheduled",
             version=version,
             branch=version_branch,
             scheduled_at=datetime.now().isoformat(),
         )
+        self._write_task(project_id, task_id, task)
+        return task
 
-    def start_task(self, project_id: str, task_id: str, branch: Optional[str] = None) -> bool:
+    def start_task(self, project_id: str, task_id: str, branch: Optional[str] = None) -> Optional[dict]:
         """
         Start working on a task.
 
         Only allowed in Do realm.
         Generates branch name if not provided.
+        Returns the updated task, or None if the transition is not allowed.
         """
         project = self.get_project(project_id)
         if not project or project.get("realm") != "do":
-            return False
+            return None
 
         task = self.get_task(project_id, task_id)
         if not task or task.get("status") != "scheduled":
-            return False
+            return None
 
         # Use the version branch already set at schedule time, then fall back to generating one
         if not branch:
@@ -593,36 +722,41 @@ class ProjectStore:
             slug = safe_filename(task["title"].lower().replace(" ", "-"))
             branch = f"{prefix}/{slug}"
 
-        return self.update_task(
-            project_id,
-            task_id,
+        task.update(
             status="in_progress",
             branch=branch,
             started_at=datetime.now().isoformat(),
         )
+        self._write_task(project_id, task_id, task)
+        return task
 
-    def complete_task(self, project_id: str, task_id: str, execution_log: str) -> bool:
+    def complete_task(self, project_id: str, task_id: str, execution_log: str | Path) -> Optional[dict]:
         """
         Mark a task as done.
 
         Only allowed in Do realm.
-        Stores the full execution log.
+        Stores the full execution log. A Path is read only once the realm and
+        status checks have passed.
+        Returns the updated task, or None if the transition is not allowed.
         """
         project = self.get_project(project_id)
         if not project or project.get("realm") != "do":
-            return False
+            return None
 
         task = self.get_task(project_id, task_id)
         if not task or task.get("status") not in ("in_progress", "blocked"):
-            return False
+            return None
 
-        return self.update_task(
-            project_id,
-            task_id,
+        if isinstance(execution_log, Path):
+            execution_log = execution_log.read_bytes().decode("utf-8", errors="replace")
+
+        task.update(
             status="done",
             execution_log=execution_log,
             completed_at=datetime.now().isoformat(),
         )
+        self._write_task(project_id, task_id, task)
+        return task
 
     def block_task(self, project_id: str, task_id: str, reason: str) -> bool:
         """Mark a task as blocked."""
@@ -689,22 +823,42 @@ class ProjectStore:
         with open(transitions_path, "a", encoding="utf-8") as f:
             f.write(entry)
 
+    @staticmethod
+    def _read_last_line(path: Path, chunk_size: int = 4096) -> str:
+        """
+        Read the last non-empty line of a file.
+
+        Reads backwards from the end in chunks, so looking up the latest
+        transition costs the same however long the log has grown.
+        """
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return ""
+
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            while pos > 0:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+                # Stop once a full line is in hand after trailing blank lines
+                if b"\n" in data.rstrip():
+                    break
+
+        return data.rstrip().rsplit(b"\n", 1)[-1].decode("utf-8").strip()
+
     def _calculate_time_in_realm(self, project_id: str) -> str:
         """Calculate time spent in current realm."""
         project_dir = self._project_dir(project_id)
         transitions_path = project_dir / "transitions.log"
 
-        if not transitions_path.exists():
-            return "unknown"
-
-        content = transitions_path.read_text().strip()
-        if not content:
+        last_line = self._read_last_line(transitions_path)
+        if not last_line:
             return "unknown"
 
-        # Get last transition timestamp
-        lines = content.split("\n")
-        last_line = lines[-1]
-
         try:
             timestamp_str = last_line.split(" | ")[0]
             last_transition = datetime.fromisoformat(timestamp_str)
@@ -960,7 +1114,56 @@ class ProjectStore:
         if version_path.exists():
             return False  # Version already exists
 
-        version_data = {
+        ensure_dir(version_path.parent)
+        version_path.write_text(yaml.dump(self._new_version(version), default_flow_style=False))
+        return True
+
+    def add_versions(
+        self,
+        project_id: str,
+        versions: list[str],
+        project: Optional[dict] = None,
+    ) -> Optional[list[str]]:
+        """
+        Add several versions to a project at once.
+
+        The project is checked once for the whole batch. Nothing is written
+        if any version already exists or appears twice in the batch.
+
+        Args:
+            project_id: Project ID
+            versions: Version strings (e.g., ["1.2.0", "1.3.0"])
+            project: Project record already loaded by the caller, if any
+
+        Returns:
+            The conflicting versions (empty when all were added), or None if
+            project not found
+        """
+        if project is None:
+            project = self.get_project(project_id)
+        if not project:
+            return None
+
+        paths = [self._version_path(project_id, version) for version in versions]
+        versions_dir = self._project_dir(project_id) / "versions"
+        taken = set(self._list_names(versions_dir, ".yaml"))
+        conflicts = []
+        for version, path in zip(versions, paths):
+            if path.name in taken:
+                conflicts.append(version)
+            taken.add(path.name)
+        if conflicts:
+            return conflicts
+
+        ensure_dir(versions_dir)
+        for version, path in zip(versions, paths):
+            path.write_text(yaml.dump(self._new_version(version), default_flow_style=False))
+        return []
+
+    @staticmethod
+    def _new_version(version: str) -> dict:
+        """Build the record for a newly planned version."""
+        return {
             "version": version,
             "status": "planned",
             "branch": f"version/{version}",
@@ -969,28 +1172,21 @@ class ProjectStore:
             "released_at": None,
         }
 
-        ensure_dir(version_path.parent)
-        version_path.write_text(yaml.dump(version_data, default_flow_style=False))
-        return True
-
     def get_version(self, project_id: str, version: str) -> Optional[dict]:
         """Get version information."""
         version_path = self._version_path(project_id, version)
         if not version_path.exists():
             return None
 
-        return yaml.safe_load(version_path.read_text())
+        return _yaml_load(version_path.read_text())
 
     def list_versions(self, project_id: str) -> list[dict]:
         """List all versions for a project."""
         versions = []
         versions_dir = self._project_dir(project_id) / "versions"
 
-        if not versions_dir.exists():
-            return versions
-
-        for version_file in sorted(versions_dir.glob("*.yaml")):
-            version_data = yaml.safe_load(version_file.read_text())
+        for name in self._list_names(versions_dir, ".yaml"):
+            version_data = _yaml_load((versions_dir / name).read_text())
             versions.append(version_data)
 
         return versions
@@ -1111,10 +1307,14 @@ class ProjectStore:
 
         return transitions
 
-    def get_realm_time(self, project_id: str) -> dict:
+    def get_realm_time(self, project_id: str, project: Optional[dict] = None) -> dict:
         """
         Calculate total time spent in each realm.
 
+        Args:
+            project_id: Project to analyse
+            project: Project record already loaded by the caller, if any
+
         Returns:
             Dict with realm names as keys and total minutes as values
         """
@@ -1146,7 +1346,8 @@ class ProjectStore:
                 realm_times[from_realm] += minutes
 
         # Add current realm time
-        project = self.get_project(project_id)
+        if project is None:
+            project = self.get_project(project_id)
         if project:
             current_realm = project.get("realm")
             if current_realm in realm_times:
@@ -1209,9 +1410,9 @@ class ProjectStore:
         stuck.sort(key=lambda x: x["minutes"], reverse=True)
         return stuck
 
-    def format_realm_time(self, project_id: str) -> str:
+    def format_realm_time(self, project_id: str, project: Optional[dict] = None) -> str:
         """Format realm time as human-readable string."""
-        realm_times = self.get_realm_time(project_id)
+        realm_times = self.get_realm_time(project_id, project)
         total = sum(realm_times.values())
 
         if total == 0:
@@ -1238,6 +1439,23 @@ class ProjectStore:
 
         return " | ".join(parts)
 
+    def get_project_view(self, project_id: str) -> Optional[dict]:
+        """
+        Get everything needed to display a project in one call.
+
+        Returns:
+            Dict with 'project', 'realm_time' and 'tasks', or None if not found
+        """
+        project = self.get_project(project_id)
+        if not project:
+            return None
+
+        return {
+            "project": project,
+            "realm_time": self.format_realm_time(project_id, project),
+            "tasks": self.list_tasks(project_id),
+        }
+
     # -------------------------------------------------------------------------
     # Summary for Memory Injection
     # -------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Audit logging for tool invocations and security events."""
 
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -192,7 +193,8 @@ class AuditLogger:
         Get recent audit events.
 
         Args:
-            limit: Maximum number of events to return.
+            limit: Maximum number of events to return; 0 or less returns
+                every event in today's log.
 
         Returns:
             List of recent audit events.
@@ -202,15 +204,15 @@ class AuditLogger:
         if not log_file.exists():
             return []
 
-        events = []
         try:
+            # Keep only the last `limit` raw lines while streaming the file,
+            # then parse just those
             with open(log_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        events.append(json.loads(line))
+                tail = deque(
+                    (line for line in f if not line.isspace()),
+                    maxlen=limit if limit > 0 else None,
+                )
+            return [json.loads(line) for line in tail]
         except Exception as e:
             logger.error(f"Failed to read audit log: {e}")
             return []
-
-        return events[-limit:]
@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -48,6 +49,9 @@ class IntegrityMonitor:
         "USER.md",
     ]
 
+    # File count from which hashes are computed on a thread pool
+    _PARALLEL_HASH_MIN = 8
+
     def __init__(
         self,
         workspace: Path,
@@ -110,19 +114,26 @@ class IntegrityMonitor:
 
     def _compute_hash(self, file_path: Path) -> str | None:
         """Compute hash of a file."""
-        if not file_path.exists():
-            return None
-
         try:
-            hasher = hashlib.new(self.config.hash_algorithm)
+            # file_digest reads into a reusable buffer and feeds it straight
+            # to the hash, instead of allocating a bytes object per chunk
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+                return hashlib.file_digest(f, self.config.hash_algorithm).hexdigest()
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to hash file {file_path}: {e}")
             return None
 
+    def _compute_hashes(self, file_paths: list[Path]) -> list[str | None]:
+        """Compute hashes for several files, in input order."""
+        # hashlib releases the GIL while digesting, so once there are enough
+        # files to pay for the threads their reads and hashing overlap
+        if len(file_paths) >= self._PARALLEL_HASH_MIN:
+            with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as pool:
+                return list(pool.map(self._compute_hash, file_paths))
+        return [self._compute_hash(file_path) for file_path in file_paths]
+
     def get_monitored_files(self) -> list[Path]:
         """Get list of all monitored file paths."""
         files = []
@@ -150,8 +161,8 @@ class IntegrityMonitor:
         """
         results = {}
 
-        for file_path in self.get_monitored_files():
-            file_hash = self._compute_hash(file_path)
+        files = self.get_monitored_files()
+        for file_path, file_hash in zip(files, self._compute_hashes(files)):
             if file_hash:
                 stat = file_path.stat()
                 self._hashes[str(file_path)] = FileHash(
@@ -179,15 +190,16 @@ class IntegrityMonitor:
 
         violations = []
 
+        # Only tracked files are hashed; new files have no baseline to compare
+        tracked = []
         for file_path in self.get_monitored_files():
-            path_str = str(file_path)
-            current_hash = self._compute_hash(file_path)
-
-            if path_str not in self._hashes:
-                # New file, not yet tracked
+            if str(file_path) in self._hashes:
+                tracked.append(file_path)
+            else:
                 logger.debug(f"File not tracked: {file_path.name}")
-                continue
 
+        for file_path, current_hash in zip(tracked, self._compute_hashes(tracked)):
+            path_str = str(file_path)
             stored = self._hashes[path_str]
 
             if current_hash is None:
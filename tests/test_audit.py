@@ -0,0 +1,34 @@
+"""Tests for the security audit log."""
+
+import pytest
+
+from aigernon.security.audit import AuditLogger
+
+
+@pytest.fixture
+def audit(tmp_path):
+    logger = AuditLogger(log_dir=tmp_path)
+    for i in range(5):
+        logger.log_access_denied(f"user{i}", "telegram", "not_in_allowlist")
+    return logger
+
+
+class TestGetRecentEvents:
+    """Tests for AuditLogger.get_recent_events."""
+
+    def test_returns_last_events_in_order(self, audit):
+        events = audit.get_recent_events(limit=2)
+
+        assert [e["user_id"] for e in events] == ["user3", "user4"]
+
+    def test_limit_larger_than_log(self, audit):
+        assert len(audit.get_recent_events(limit=100)) == 5
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_non_positive_limit_returns_everything(self, audit, limit):
+        events = audit.get_recent_events(limit=limit)
+
+        assert [e["user_id"] for e in events] == [f"user{i}" for i in range(5)]
+
+    def test_missing_log(self, tmp_path):
+        assert AuditLogger(log_dir=tmp_path).get_recent_events() == []
@@ -0,0 +1,79 @@
+"""Tests for config loading and its parsed-file cache."""
+
+import json
+import os
+
+import pytest
+
+from aigernon.config import loader
+from aigernon.config.loader import load_config, save_config
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    monkeypatch.setattr(loader, "_CONFIG_CACHE", None)
+
+
+def _write(path, model, mtime_ns=None):
+    path.write_text(json.dumps({"agents": {"defaults": {"model": model}}}))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestConfigCache:
+    """Tests for the mtime/size keyed load_config cache."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.json"
+        _write(path, "model-a")
+        first = load_config(path)
+
+        calls = []
+        monkeypatch.setattr(loader, "_migrate_config", lambda d: calls.append(d) or d)
+        second = load_config(path)
+
+        assert calls == []
+        assert second.agents.defaults.model == first.agents.defaults.model == "model-a"
+
+    def test_mtime_change_invalidates(self, tmp_path):
+        path = tmp_path / "config.json"
+        _write(path, "model-a", mtime_ns=1_000_000_000)
+        assert load_config(path).agents.defaults.model == "model-a"
+
+        # Same size, different mtime
+        _write(path, "model-b", mtime_ns=2_000_000_000)
+        assert load_config(path).agents.defaults.model == "model-b"
+
+    def test_size_change_invalidates(self, tmp_path):
+        path = tmp_path / "config.json"
+        _write(path, "model-a", mtime_ns=1_000_000_000)
+        assert load_config(path).agents.defaults.model == "model-a"
+
+        # Same mtime, different size
+        _write(path, "model-longer", mtime_ns=1_000_000_000)
+        assert load_config(path).agents.defaults.model == "model-longer"
+
+    def test_save_config_gives_fresh_object(self, tmp_path):
+        path = tmp_path / "config.json"
+        _write(path, "model-a")
+        config = load_config(path)
+
+        config.agents.defaults.model = "model-saved"
+        save_config(config, path)
+        reloaded = load_config(path)
+
+        assert reloaded is not config
+        assert reloaded.agents.defaults.model == "model-saved"
+
+    def test_returned_config_is_a_copy(self, tmp_path):
+        path = tmp_path / "config.json"
+        _write(path, "model-a")
+
+        first = load_config(path)
+        first.agents.defaults.model = "mutated"
+        first.providers.openai.api_key = "mutated"
+
+        second = load_config(path)
+        assert second is not first
+        assert second.agents.defaults.model == "model-a"
+        assert second.providers.openai.api_key == ""
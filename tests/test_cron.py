@@ -0,0 +1,110 @@
+"""Tests for the cron service store and `cron add-batch`."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from aigernon.cli import commands
+from aigernon.config import loader
+from aigernon.cron.service import CronService
+from aigernon.cron.types import CronSchedule
+
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def store_path(tmp_path, monkeypatch):
+    """jobs.json under a temp data dir, also used by the CLI commands."""
+    monkeypatch.setattr(loader, "get_data_dir", lambda: tmp_path)
+    return tmp_path / "cron" / "jobs.json"
+
+
+def _every(seconds):
+    return CronSchedule(kind="every", every_ms=seconds * 1000)
+
+
+class TestAddJobs:
+    """Tests for CronService.add_jobs."""
+
+    def test_single_save_per_batch(self, store_path, monkeypatch):
+        service = CronService(store_path)
+        saves = []
+        original = service._save_store
+        monkeypatch.setattr(service, "_save_store", lambda: saves.append(1) or original())
+
+        jobs = service.add_jobs([
+            {"name": f"job{i}", "schedule": _every(60 + i), "message": "hi"}
+            for i in range(5)
+        ])
+
+        assert len(saves) == 1
+        assert [j.name for j in jobs] == [f"job{i}" for i in range(5)]
+        assert len(CronService.read_jobs(store_path)) == 5
+
+    def test_appends_to_existing_jobs(self, store_path):
+        CronService(store_path).add_job("first", _every(60), "hi")
+        CronService(store_path).add_jobs([{"name": "second", "schedule": _every(120), "message": "yo"}])
+
+        assert [j.name for j in CronService.read_jobs(store_path)] == ["first", "second"]
+
+
+class TestReadJobs:
+    """read_jobs must match list_jobs for every filter."""
+
+    def test_matches_list_jobs(self, store_path):
+        service = CronService(store_path)
+        service.add_job("a", _every(300), "a", instance_id="one")
+        service.add_job("b", _every(60), "b", instance_id="two")
+        disabled = service.add_job("c", _every(120), "c", instance_id="one")
+        service.enable_job(disabled.id, enabled=False)
+
+        fresh = CronService(store_path)
+        for include_disabled in (False, True):
+            for instance_id in (None, "one", "two"):
+                listed = fresh.list_jobs(include_disabled=include_disabled, instance_id=instance_id)
+                read = CronService.read_jobs(store_path, include_disabled, instance_id)
+                assert [j.id for j in read] == [j.id for j in listed]
+
+    def test_missing_store(self, store_path):
+        assert CronService.read_jobs(store_path) == []
+
+
+class TestCronAddBatchCommand:
+    """Tests for `cron add-batch`."""
+
+    def test_happy_path(self, store_path):
+        lines = [
+            json.dumps({"name": "a", "message": "hi", "every": 60}),
+            json.dumps({"name": "b", "message": "yo", "cron": "0 9 * * *", "deliver": True, "to": "me"}),
+            json.dumps({"name": "c", "message": "once", "at": "2030-01-01T10:00:00"}),
+        ]
+        result = runner.invoke(commands.app, ["cron", "add-batch"], input="\n".join(lines))
+
+        assert result.exit_code == 0, result.output
+        jobs = {j.name: j for j in CronService.read_jobs(store_path)}
+        assert sorted(jobs) == ["a", "b", "c"]
+        assert jobs["b"].schedule.expr == "0 9 * * *"
+        assert jobs["b"].payload.deliver and jobs["b"].payload.to == "me"
+
+    @pytest.mark.parametrize("bad", [
+        "{not json",
+        json.dumps({"name": "x"}),
+        json.dumps({"name": "x", "message": "no schedule"}),
+        json.dumps({"name": "x", "message": "bad at", "at": "not a date"}),
+    ])
+    def test_invalid_line_writes_nothing(self, store_path, bad):
+        lines = [json.dumps({"name": "a", "message": "hi", "every": 60}), bad]
+        result = runner.invoke(commands.app, ["cron", "add-batch"], input="\n".join(lines))
+
+        assert result.exit_code == 1
+        assert "Line 2" in result.output
+        assert not store_path.exists()
+
+    def test_empty_input(self, store_path):
+        result = runner.invoke(commands.app, ["cron", "add-batch"], input="\n")
+
+        assert result.exit_code == 0
+        assert "No jobs to add." in result.output
+        assert not store_path.exists()
@@ -0,0 +1,53 @@
+"""Tests for the agent memory store's daily notes."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from aigernon.agent import memory
+from aigernon.agent.memory import MemoryStore
+
+
+class TestDailyNotes:
+    """Tests for get_today_file/append_today."""
+
+    def test_first_append_writes_header(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(memory, "today_date", lambda: "2026-01-05")
+        store = MemoryStore(tmp_path)
+
+        store.append_today("first")
+
+        assert store.get_today_file() == tmp_path / "memory" / "2026-01-05.md"
+        assert store.read_today() == "# 2026-01-05\n\nfirst"
+
+    def test_later_appends_do_not_repeat_header(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(memory, "today_date", lambda: "2026-01-05")
+        store = MemoryStore(tmp_path)
+
+        store.append_today("first")
+        store.append_today("second")
+        # A fresh store (new process) appending to the existing file
+        MemoryStore(tmp_path).append_today("third")
+
+        content = store.read_today()
+        assert content == "# 2026-01-05\n\nfirst\nsecond\nthird"
+        assert content.count("# 2026-01-05") == 1
+
+    def test_rollover_after_cached_expiry(self, tmp_path, monkeypatch):
+        day = ["2026-01-05"]
+        now = [datetime(2026, 1, 5, 23, 59).timestamp()]
+        monkeypatch.setattr(memory, "today_date", lambda: day[0])
+        monkeypatch.setattr(memory, "time", SimpleNamespace(time=lambda: now[0]))
+        store = MemoryStore(tmp_path)
+        store.append_today("monday")
+
+        # Before the cached midnight the path is reused without a date lookup
+        day[0] = "2026-01-06"
+        assert store.get_today_file().name == "2026-01-05.md"
+
+        # Once midnight has passed, the next day's file is used
+        now[0] = datetime(2026, 1, 6, 0, 1).timestamp()
+        store.append_today("tuesday")
+
+        assert store.get_today_file().name == "2026-01-06.md"
+        assert store.read_today() == "# 2026-01-06\n\ntuesday"
+        assert (tmp_path / "memory" / "2026-01-05.md").read_text() == "# 2026-01-05\n\nmonday"
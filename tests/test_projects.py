@@ -0,0 +1,181 @@
+"""Tests for the project store batch operations and add-batch commands."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from aigernon.cli import commands
+from aigernon.projects.store import ProjectStore
+
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A ProjectStore in a temp workspace, also used by the CLI commands."""
+    s = ProjectStore(tmp_path)
+    monkeypatch.setattr(commands, "_get_project_store", lambda: s)
+    return s
+
+
+@pytest.fixture
+def project_id(store):
+    return store.add_project("My App", "git@example.com:me/app.git")
+
+
+class TestAddTasksBatch:
+    """Tests for ProjectStore.add_tasks and `tasks add-batch`."""
+
+    def test_store_add_tasks(self, store, project_id):
+        task_ids = store.add_tasks(project_id, [{"title": "One"}, {"title": "Two", "type": "bug"}])
+
+        assert task_ids == ["001", "002"]
+        assert store.get_task(project_id, "002")["type"] == "bug"
+
+    def test_store_add_tasks_unknown_project(self, store):
+        assert store.add_tasks("nope", [{"title": "One"}]) is None
+
+    def test_cli_happy_path(self, store, project_id):
+        lines = [json.dumps({"title": "One"}), json.dumps("Two")]
+        result = runner.invoke(commands.app, ["tasks", "add-batch", project_id], input="\n".join(lines))
+
+        assert result.exit_code == 0, result.output
+        assert [t["title"] for t in store.list_tasks(project_id)] == ["One", "Two"]
+
+    def test_cli_invalid_line_writes_nothing(self, store, project_id):
+        lines = [json.dumps({"title": "One"}), "{not json"]
+        result = runner.invoke(commands.app, ["tasks", "add-batch", project_id], input="\n".join(lines))
+
+        assert result.exit_code == 1
+        assert "Line 2" in result.output
+        assert store.list_tasks(project_id) == []
+
+    def test_cli_empty_input(self, store, project_id):
+        result = runner.invoke(commands.app, ["tasks", "add-batch", project_id], input="\n\n")
+
+        assert result.exit_code == 0
+        assert "No tasks to add." in result.output
+        assert store.list_tasks(project_id) == []
+
+
+class TestAddIdeaItemsBatch:
+    """Tests for ProjectStore.add_idea_items and `ideas add-item-batch`."""
+
+    def test_store_add_idea_items(self, store):
+        idea_id = store.add_idea("Big Idea")
+
+        assert store.add_idea_items(idea_id, ["first", "second"])
+        assert store.get_idea(idea_id)["items"] == ["first", "second"]
+
+    def test_store_add_idea_items_unknown_idea(self, store):
+        assert store.add_idea_items("nope", ["first"]) is False
+
+    def test_cli_happy_path(self, store):
+        idea_id = store.add_idea("Big Idea")
+        result = runner.invoke(commands.app, ["ideas", "add-item-batch", idea_id], input="first\nsecond\n")
+
+        assert result.exit_code == 0, result.output
+        assert store.get_idea(idea_id)["items"] == ["first", "second"]
+
+    def test_cli_unknown_idea_writes_nothing(self, store):
+        result = runner.invoke(commands.app, ["ideas", "add-item-batch", "nope"], input="first\n")
+
+        assert result.exit_code == 1
+        assert store.list_ideas() == []
+
+    def test_cli_empty_input(self, store):
+        idea_id = store.add_idea("Big Idea")
+        result = runner.invoke(commands.app, ["ideas", "add-item-batch", idea_id], input="")
+
+        assert result.exit_code == 0
+        assert "No items to add." in result.output
+        assert store.get_idea(idea_id)["items"] == []
+
+
+class TestAddVersionsBatch:
+    """Tests for ProjectStore.add_versions and `versions add-batch`."""
+
+    def test_store_add_versions(self, store, project_id):
+        assert store.add_versions(project_id, ["1.0", "1.1"]) == []
+        assert [v["version"] for v in store.list_versions(project_id)] == ["1.0", "1.1"]
+
+    def test_store_add_versions_conflict_writes_nothing(self, store, project_id):
+        store.add_version(project_id, "1.0")
+
+        assert store.add_versions(project_id, ["1.1", "1.0", "1.2", "1.2"]) == ["1.0", "1.2"]
+        assert [v["version"] for v in store.list_versions(project_id)] == ["1.0"]
+
+    def test_store_add_versions_unknown_project(self, store):
+        assert store.add_versions("nope", ["1.0"]) is None
+
+    def test_cli_happy_path(self, store, project_id):
+        result = runner.invoke(commands.app, ["versions", "add-batch", project_id], input="1.0\n1.1\n")
+
+        assert result.exit_code == 0, result.output
+        assert "Added 2 version(s)" in result.output
+        assert len(store.list_versions(project_id)) == 2
+
+    def test_cli_existing_version_fails(self, store, project_id):
+        store.add_version(project_id, "1.0")
+        result = runner.invoke(commands.app, ["versions", "add-batch", project_id], input="1.1\n1.0\n")
+
+        assert result.exit_code == 1
+        assert [v["version"] for v in store.list_versions(project_id)] == ["1.0"]
+
+    def test_cli_empty_input(self, store, project_id):
+        result = runner.invoke(commands.app, ["versions", "add-batch", project_id], input="")
+
+        assert result.exit_code == 0
+        assert "No versions to add." in result.output
+        assert store.list_versions(project_id) == []
+
+
+class TestListTasksFilter:
+    """Tests for list_tasks status/version filtering and its raw-text prefilter."""
+
+    @staticmethod
+    def _write(store, project_id, task_id, body):
+        path = store._task_path(project_id, task_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"id: '{task_id}'\ntitle: Task {task_id}\n{body}")
+
+    def _ids(self, store, project_id, **filters):
+        return [t["id"] for t in store.list_tasks(project_id, **filters)]
+
+    def test_near_miss_substring_is_not_a_match(self, store, project_id):
+        self._write(store, project_id, "001", "status: done\n")
+        self._write(store, project_id, "002", "status: undone\n")
+        self._write(store, project_id, "003", "status: draft\ndescription: not done yet\n")
+
+        assert self._ids(store, project_id, status="done") == ["001"]
+        assert self._ids(store, project_id, status="do") == []
+
+    def test_quoted_values_match(self, store, project_id):
+        self._write(store, project_id, "001", "status: \"done\"\nversion: '1.0'\n")
+        self._write(store, project_id, "002", "status: 'done'\nversion: \"1.0\"\n")
+        self._write(store, project_id, "003", "status: done\nversion: '1.1'\n")
+
+        assert self._ids(store, project_id, status="done", version="1.0") == ["001", "002"]
+
+    def test_escaped_value_matches(self, store, project_id):
+        # "d\x6fne" is "done" once parsed, but never appears literally
+        self._write(store, project_id, "001", 'status: "d\\x6fne"\n')
+
+        assert self._ids(store, project_id, status="done") == ["001"]
+
+    def test_values_yaml_would_quote_match(self, store, project_id):
+        store.add_tasks(project_id, [{"title": "One"}, {"title": "Two"}])
+        store.update_task(project_id, "001", version="yes")
+        store.update_task(project_id, "002", version="2.0")
+
+        assert self._ids(store, project_id, version="yes") == ["001"]
+        assert self._ids(store, project_id, version="2.0") == ["002"]
+
+    def test_non_verbatim_filter_value(self, store, project_id):
+        self._write(store, project_id, "001", "status: in review\n")
+        self._write(store, project_id, "002", "status: \"it's done\"\n")
+
+        assert self._ids(store, project_id, status="in review") == ["001"]
+        assert self._ids(store, project_id, status="it's done") == ["002"]
@@ -2,6 +2,7 @@ from typing import Any
 
 from aigernon.agent.tools.base import Tool
 from aigernon.agent.tools.registry import ToolRegistry
+from aigernon.agent.tools.shell import ExecTool
 
 
 class SampleTool(Tool):
@@ -86,3 +87,35 @@ async def test_registry_returns_validation_error() -> None:
     reg.register(SampleTool())
     result = await reg.execute("sample", {"query": "hi"})
     assert "Invalid parameters" in result
+
+
+def test_exec_guard_blocks_critical_and_extra_deny_patterns() -> None:
+    tool = ExecTool(deny_patterns=[r"\bcurl\b.*evil"])
+    assert "dangerous operation" in tool._guard_command("rm -rf /", "/tmp")
+    assert "dangerous operation" in tool._guard_command("sudo shutdown now", "/tmp")
+    assert "pattern denied" in tool._guard_command("curl http://evil.example", "/tmp")
+    assert tool._guard_command("curl http://example.com", "/tmp") is None
+
+
+def test_exec_guard_user_deny_patterns_keep_flags_and_groups() -> None:
+    tool = ExecTool(deny_patterns=[r"(?i)secret", r"(\w+) \1"])
+    assert "pattern denied" in tool._guard_command("cat SECRET.txt", "/tmp")
+    assert "pattern denied" in tool._guard_command("echo echo", "/tmp")
+    assert tool._guard_command("echo hi", "/tmp") is None
+
+
+def test_exec_guard_allowlist() -> None:
+    tool = ExecTool(allow_patterns=[r"^foo\b"])
+    assert tool._guard_command("git status", "/tmp") is None
+    assert tool._guard_command("Git Log", "/tmp") is None
+    assert tool._guard_command("foo bar", "/tmp") is None
+    assert "not in allowlist" in tool._guard_command("bar baz", "/tmp")
+
+
+def test_registry_definitions_refresh_on_register() -> None:
+    reg = ToolRegistry(enable_audit=False)
+    assert reg.get_definitions() == []
+    reg.register(SampleTool())
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample"]
+    reg.unregister("sample")
+    assert reg.get_definitions() == []